@@ -1,6 +1,59 @@
 # Import the style components from tStyle.py
-from tStyle import BankAccount, BillingStyle, AccountManager, generate_token
+from tStyle import BankAccount, BillingStyle, AccountManager, generate_token, format_currency
 import sys
+import math
+import atexit
+
+
+# Services and bills offered from the main menu as (name, description) pairs
+SERVICES = (
+    ("Electricity", "Electricity Tokens"),
+    ("Data", "Mobile Data Bundle"),
+    ("Airtime", "Mobile Airtime"),
+    ("Water", "Water Tokens"),
+    ("Gaming", "Gaming Voucher")
+)
+
+BILLS = (
+    ("Netflix", "Streaming Subscription"),
+    ("Internet", "Internet Service Provider"),
+    ("Insurance", "Monthly Insurance Premium"),
+    ("Gym", "Gym Membership Fee"),
+    ("Rent", "Monthly Rent Payment")
+)
+
+# Menu listings are static, so render them once at import time
+_SERVICES_MENU_STR = "\n".join(f"{i}. {service} - {description}" for i, (service, description) in enumerate(SERVICES, 1))
+_BILLS_MENU_STR = "\n".join(f"{i}. {bill} - {description}" for i, (bill, description) in enumerate(BILLS, 1))
+_SERVICES_BACK = len(SERVICES) + 1
+_SERVICES_BACK_LINE = f"{_SERVICES_BACK}. Back to Main Menu"
+_BILLS_BACK = len(BILLS) + 1
+_BILLS_BACK_LINE = f"{_BILLS_BACK}. Back to Main Menu"
+
+# Options for the logged-out and logged-in menus
+ACCOUNT_MENU_OPTIONS = (
+    "Create New Account",
+    "Select Existing Account",
+    "View Account Details",
+    "Exit System"
+)
+
+MAIN_MENU_OPTIONS = (
+    "Purchase Services",
+    "Pay Bills",
+    "Deposit Money",
+    "Withdraw Money",
+    "Check Balance",
+    "Account Information",
+    "Logout",
+    "Exit System"
+)
+
+# Currency symbols, separators and spaces removed from typed amounts in one pass
+_CURRENCY_STRIP = str.maketrans('', '', 'R,$ ')
+
+# Number of registry updates held in memory before they are written to disk
+REGISTRY_FLUSH_INTERVAL = 16
 
 
 class BillingSystem:
@@ -9,38 +62,86 @@ class BillingSystem:
     def __init__(self):
         self.account_manager = AccountManager()
         self.style = BillingStyle()
+        # Bind frequently used style methods once for the menu loop
+        self._print_header = self.style.print_header
+        self._print_sep = self.style.print_separator
+        self._clear = self.style.clear_screen
+        self._err = self.style.print_error_message
+        self._ok = self.style.print_success_message
         self.current_account = None
+        # Name of the logged-in account holder, fixed for the session
+        self._current_name = None
         self.running = True
+        # Account registry, loaded on first use and dropped on mutation
+        self._accounts_cache = None
+        # Registry balance updates not yet written to disk
+        self._registry_dirty = False
+        self._pending_updates = 0
+        # Registry writes are batched, so write whatever is left when the program exits
+        atexit.register(self._flush_registry)
+        # Balance of the logged-in account and its display string, refreshed after each transaction
+        self._balance = None
+        self._balance_str = None
+
+        # Static menu chrome is rendered once; only account lines change per redraw
+        self._account_menu_header = self.style.format_header("ACCOUNT MANAGEMENT")
+        self._account_menu_text = self.style.format_menu(ACCOUNT_MENU_OPTIONS)
+        self._main_menu_header = self.style.format_header("MAIN MENU")
+        self._main_menu_text = self.style.format_menu(MAIN_MENU_OPTIONS)
+
+        # Menu choice handlers
+        self._acct_dispatch = {
+            1: self.create_new_account,
+            2: self.select_account,
+            3: self.view_account_details,
+            4: self.handle_exit
+        }
+        self._main_dispatch = {
+            1: self.purchase_services_menu,
+            2: self.pay_bills_menu,
+            3: self.deposit_money,
+            4: self.withdraw_money,
+            5: self.check_balance,
+            6: self.show_account_info,
+            7: self.logout,
+            8: self.handle_exit
+        }
 
     def start(self):
         """Start the billing system"""
-        self.style.clear_screen()
-        self.style.print_header("JM TSIE BILLING SYSTEM")
+        self._clear()
+        self._print_header("JM TSIE BILLING SYSTEM")
         print("Welcome to the billing management system!")
         print("Features: Account Management, Transactions, File Storage")
-        self.style.print_separator()
+        self._print_sep()
 
         self.main_loop()
 
     def main_loop(self):
         """Main program loop"""
+        # Handlers sit outside the menu loop, which is re-entered after an interruption or error
         while self.running:
             try:
-                if self.current_account:
-                    self.show_main_menu()
-                else:
-                    self.show_account_menu()
+                self.run_menus()
             except KeyboardInterrupt:
                 self.handle_exit()
             except Exception as e:
-                self.style.print_error_message(f"System error: {e}")
+                self._err(f"System error: {e}")
                 print("Please try again or restart the system.")
 
+    def run_menus(self):
+        """Show the menu for the current session until the system stops"""
+        while self.running:
+            if self.current_account:
+                self.show_main_menu()
+            else:
+                self.show_account_menu()
+
     def show_account_menu(self):
         """Display account selection/creation menu"""
-        accounts = self.account_manager.get_accounts_list()
+        accounts = self._accounts()
 
-        self.style.print_header("ACCOUNT MANAGEMENT")
+        sys.stdout.write(self._account_menu_header)
 
         if accounts:
             self.style.print_accounts_list(accounts)
@@ -48,29 +149,17 @@ class BillingSystem:
         else:
             print("No accounts found. Create your first account!")
 
-        menu_options = [
-            "Create New Account",
-            "Select Existing Account",
-            "View Account Details",
-            "Exit System"
-        ]
-
-        self.style.print_menu(menu_options)
+        sys.stdout.write(self._account_menu_text)
 
-        choice = self.get_menu_choice(1, 4)
+        choice = self.get_menu_choice(1, len(ACCOUNT_MENU_OPTIONS))
         if choice:
             self.handle_account_menu_choice(choice)
 
     def handle_account_menu_choice(self, choice):
         """Handle account menu selections"""
-        if choice == 1:
-            self.create_new_account()
-        elif choice == 2:
-            self.select_account()
-        elif choice == 3:
-            self.view_account_details()
-        elif choice == 4:
-            self.handle_exit()
+        handler = self._acct_dispatch.get(choice)
+        if handler:
+            handler()
 
     def create_new_account(self):
         """Create a new user account"""
@@ -80,7 +169,7 @@ class BillingSystem:
             # Get account name
             name = input("Enter account holder name: ").strip()
             if not name:
-                self.style.print_error_message("Name cannot be empty!")
+                self._err("Name cannot be empty!")
                 return
 
             # Get initial balance
@@ -89,212 +178,245 @@ class BillingSystem:
             if balance_input:
                 try:
                     # Remove currency symbols and commas
-                    clean_input = balance_input.replace('R', '').replace(',', '').strip()
+                    clean_input = balance_input.translate(_CURRENCY_STRIP).strip()
                     initial_balance = float(clean_input)
 
+                    if not math.isfinite(initial_balance):
+                        raise ValueError(clean_input)
+
                     if initial_balance < 0:
-                        self.style.print_error_message("Balance cannot be negative!")
+                        self._err("Balance cannot be negative!")
                         return
 
                 except ValueError:
-                    self.style.print_error_message("Invalid balance format!")
+                    self._err("Invalid balance format!")
                     return
             else:
                 initial_balance = 1000000
 
-            # Create the account
+            # Create the account from an up to date registry
+            self._flush_registry()
             account_id, account_info = self.account_manager.create_new_account(name, initial_balance)
+            if self._registry_dirty:
+                # Keep the unsaved updates so the next flush still writes them
+                self._accounts()[account_id] = dict(account_info)
+            else:
+                self._accounts_cache = None
 
-            self.style.print_success_message(
+            self._ok(
                 f"Account created successfully!\n"
                 f"Account ID: {account_id}\n"
                 f"Name: {name}\n"
-                f"Initial Balance: R{initial_balance:,.2f}"
+                f"Initial Balance: {format_currency(initial_balance)}"
             )
 
             # Ask if user wants to login immediately
             login_choice = input("Login to this account now? (y/N): ").lower()
             if login_choice in ['y', 'yes']:
                 self.current_account = BankAccount(account_id, self.account_manager)
-                self.style.print_success_message(f"Logged into account: {name}")
+                self._balance = None
+                self._balance_str = None
+                self._current_name = account_info['name']
+                self._ok(f"Logged into account: {name}")
 
         except Exception as e:
-            self.style.print_error_message(f"Failed to create account: {e}")
+            self._err(f"Failed to create account: {e}")
 
     def select_account(self):
         """Select an existing account"""
-        accounts = self.account_manager.get_accounts_list()
+        accounts = self._accounts()
 
         if not accounts:
-            self.style.print_error_message("No accounts available!")
+            self._err("No accounts available!")
             return
 
         self.style.print_section_title("SELECT ACCOUNT")
         self.style.print_accounts_list(accounts)
 
         try:
-            account_id = input("Enter Account ID: ").strip()
+            account_id = int(input("Enter Account ID: ").strip())
 
             if account_id in accounts:
-                self.current_account = BankAccount(int(account_id), self.account_manager)
+                self.current_account = BankAccount(account_id, self.account_manager)
+                self._balance = None
+                self._balance_str = None
                 account_name = accounts[account_id]['name']
-                balance = self.current_account.get_balance()
+                self._current_name = account_name
+                self._current_balance()
 
-                self.style.print_success_message(
+                self._ok(
                     f"Successfully logged into: {account_name}\n"
-                    f"Current Balance: R{balance:,.2f}"
+                    f"Current Balance: {self._balance_str}"
                 )
             else:
-                self.style.print_error_message("Account ID not found!")
+                self._err("Account ID not found!")
 
         except ValueError:
-            self.style.print_error_message("Invalid Account ID!")
+            self._err("Invalid Account ID!")
         except Exception as e:
-            self.style.print_error_message(f"Login error: {e}")
+            self._err(f"Login error: {e}")
 
     def view_account_details(self):
         """View detailed information for all accounts"""
-        accounts = self.account_manager.get_accounts_list()
+        # Stream from the on-disk registry, so write any pending updates first
+        if self._flush_registry():
+            accounts = self.account_manager.iter_accounts()
+        else:
+            # The unsaved updates only exist in the cached registry
+            accounts = self._accounts().items()
 
         self.style.print_section_title("ACCOUNT DETAILS")
 
-        if not accounts:
-            print("No accounts found.")
-        else:
-            for acc_id, acc_info in accounts.items():
-                # Get current balance from file
-                temp_account = BankAccount(int(acc_id), self.account_manager)
-                current_balance = temp_account.get_balance()
+        # Write each account as it is read so only one entry is held at a time
+        found = False
+        for acc_id, acc_info in accounts:
+            found = True
+            current_balance = self.get_cached_balance(acc_id)
+
+            sys.stdout.write(
+                f"\nAccount ID: {acc_id}\n"
+                f"Name: {acc_info['name']}\n"
+                f"Created: {acc_info['created']}\n"
+                f"Current Balance: {format_currency(current_balance)}\n"
+                f"{'-' * 40}\n"
+            )
 
-                print(f"\nAccount ID: {acc_id}")
-                print(f"Name: {acc_info['name']}")
-                print(f"Created: {acc_info['created']}")
-                print(f"Current Balance: R{current_balance:,.2f}")
-                print("-" * 40)
+        if not found:
+            print("No accounts found.")
+        sys.stdout.flush()
 
         input("\nPress Enter to continue...")
 
+    def _accounts(self):
+        """Get the account registry, reading it from disk only when not cached"""
+        if self._accounts_cache is None:
+            accounts = self.account_manager.get_accounts_list()
+
+            # Balance files are written on every transaction but the registry only in batches,
+            # so bring registry balances up to date in case the last session ended before a flush
+            for acc_id, acc_info in accounts.items():
+                if isinstance(acc_info, dict):
+                    balance = self.account_manager.read_balance(acc_id)
+                    if acc_info.get('balance') != balance:
+                        acc_info['balance'] = balance
+                        self._registry_dirty = True
+
+            self._accounts_cache = accounts
+        return self._accounts_cache
+
+    def _current_balance(self):
+        """Get the logged-in account balance, reading it only when not cached"""
+        if self._balance is None:
+            self._refresh_balance()
+        return self._balance
+
+    def _refresh_balance(self):
+        """Re-read the logged-in account balance and rebuild its display string"""
+        self._balance = self.current_account.get_balance()
+        self._balance_str = format_currency(self._balance)
+        return self._balance
+
+    def get_cached_balance(self, acc_id):
+        """Get an account balance from its balance file, re-read only when the file changed"""
+        return self.account_manager.read_balance(acc_id)
+
     def show_main_menu(self):
         """Display main menu for logged-in users"""
-        accounts = self.account_manager.get_accounts_list()
-        account_name = accounts[str(self.current_account.account_id)]['name']
-        current_balance = self.current_account.get_balance()
-
-        self.style.print_header("MAIN MENU")
-        print(f"Account: {account_name}")
-        print(f"Balance: R{current_balance:,.2f}")
-
-        menu_options = [
-            "Purchase Services",
-            "Pay Bills",
-            "Deposit Money",
-            "Withdraw Money",
-            "Check Balance",
-            "Account Information",
-            "Logout",
-            "Exit System"
-        ]
-
-        self.style.print_menu(menu_options)
-
-        choice = self.get_menu_choice(1, 8)
+        self._current_balance()
+
+        sys.stdout.write(
+            f"{self._main_menu_header}"
+            f"Account: {self._current_name}\n"
+            f"Balance: {self._balance_str}\n"
+            f"{self._main_menu_text}"
+        )
+
+        choice = self.get_menu_choice(1, len(MAIN_MENU_OPTIONS))
         if choice:
             self.handle_main_menu_choice(choice)
 
     def handle_main_menu_choice(self, choice):
         """Handle main menu selections"""
-        if choice == 1:
-            self.purchase_services_menu()
-        elif choice == 2:
-            self.pay_bills_menu()
-        elif choice == 3:
-            self.deposit_money()
-        elif choice == 4:
-            self.withdraw_money()
-        elif choice == 5:
-            self.check_balance()
-        elif choice == 6:
-            self.show_account_info()
-        elif choice == 7:
-            self.logout()
-        elif choice == 8:
-            self.handle_exit()
+        handler = self._main_dispatch.get(choice)
+        if handler:
+            handler()
 
     def purchase_services_menu(self):
         """Handle service purchases"""
         self.style.print_section_title("PURCHASE SERVICES")
 
-        services = [
-            ("Electricity", "Electricity Tokens"),
-            ("Data", "Mobile Data Bundle"),
-            ("Airtime", "Mobile Airtime"),
-            ("Water", "Water Tokens"),
-            ("Gaming", "Gaming Voucher")
-        ]
-
-        print("Available Services:")
-        for i, (service, description) in enumerate(services, 1):
-            print(f"{i}. {service} - {description}")
-        print(f"{len(services) + 1}. Back to Main Menu")
+        sys.stdout.write(
+            "Available Services:\n"
+            f"{_SERVICES_MENU_STR}\n"
+            f"{_SERVICES_BACK_LINE}\n"
+        )
 
-        self.style.print_separator()
+        self._print_sep()
 
-        choice = self.get_menu_choice(1, len(services) + 1)
-        if choice and choice <= len(services):
-            service_name, service_desc = services[choice - 1]
+        choice = self.get_menu_choice(1, _SERVICES_BACK)
+        if choice and choice < _SERVICES_BACK:
+            service_name, service_desc = SERVICES[choice - 1]
             self.process_purchase(service_name, service_desc)
-        # If choice is len(services) + 1, it goes back automatically
+        # If choice is _SERVICES_BACK, it goes back automatically
 
     def pay_bills_menu(self):
         """Handle bill payments"""
         self.style.print_section_title("PAY BILLS")
 
-        bills = [
-            ("Netflix", "Streaming Subscription"),
-            ("Internet", "Internet Service Provider"),
-            ("Insurance", "Monthly Insurance Premium"),
-            ("Gym", "Gym Membership Fee"),
-            ("Rent", "Monthly Rent Payment")
-        ]
+        sys.stdout.write(
+            "Available Bills:\n"
+            f"{_BILLS_MENU_STR}\n"
+            f"{_BILLS_BACK_LINE}\n"
+        )
 
-        print("Available Bills:")
-        for i, (bill, description) in enumerate(bills, 1):
-            print(f"{i}. {bill} - {description}")
-        print(f"{len(bills) + 1}. Back to Main Menu")
+        self._print_sep()
 
-        self.style.print_separator()
-
-        choice = self.get_menu_choice(1, len(bills) + 1)
-        if choice and choice <= len(bills):
-            bill_name, bill_desc = bills[choice - 1]
+        choice = self.get_menu_choice(1, _BILLS_BACK)
+        if choice and choice < _BILLS_BACK:
+            bill_name, bill_desc = BILLS[choice - 1]
             self.process_payment(bill_name, bill_desc)
 
+    def _read_amount(self, prompt):
+        """Read a positive transaction amount, reporting invalid input"""
+        amount_input = input(prompt).strip().translate(_CURRENCY_STRIP)
+
+        try:
+            amount = float(amount_input)
+            if not math.isfinite(amount):
+                raise ValueError(amount_input)
+        except ValueError:
+            self._err("Invalid amount! Please enter a valid number.")
+            return None
+
+        if amount <= 0:
+            self._err("Amount must be greater than zero!")
+            return None
+
+        return amount
+
     def process_purchase(self, service, description):
         """Process a service purchase"""
         self.style.print_section_title(f"PURCHASE {service.upper()}")
         print(f"Service: {description}")
 
         try:
-            amount = float(input(f"Enter amount for {service}: R"))
-
-            if amount <= 0:
-                self.style.print_error_message("Amount must be greater than zero!")
+            amount = self._read_amount(f"Enter amount for {service}: R")
+            if amount is None:
                 return
 
             success, message = self.current_account.withdraw(amount)
 
             if success:
+                self._refresh_balance()
                 token = generate_token()
                 self.style.print_transaction(amount, service, token)
-                print(f"New Balance: R{self.current_account.get_balance():,.2f}")
+                print(f"New Balance: {self._balance_str}")
                 self.update_account_registry()
             else:
-                self.style.print_error_message(f"Purchase failed: {message}")
+                self._err(f"Purchase failed: {message}")
 
-        except ValueError:
-            self.style.print_error_message("Invalid amount! Please enter a valid number.")
         except Exception as e:
-            self.style.print_error_message(f"Purchase error: {e}")
+            self._err(f"Purchase error: {e}")
 
     def process_payment(self, bill, description):
         """Process a bill payment"""
@@ -302,90 +424,81 @@ class BillingSystem:
         print(f"Bill: {description}")
 
         try:
-            amount = float(input(f"Enter payment amount for {bill}: R"))
-
-            if amount <= 0:
-                self.style.print_error_message("Amount must be greater than zero!")
+            amount = self._read_amount(f"Enter payment amount for {bill}: R")
+            if amount is None:
                 return
 
             success, message = self.current_account.withdraw(amount)
 
             if success:
+                self._refresh_balance()
                 self.style.print_transaction(amount, f"{bill} Bill Payment")
-                print(f"New Balance: R{self.current_account.get_balance():,.2f}")
+                print(f"New Balance: {self._balance_str}")
                 self.update_account_registry()
             else:
-                self.style.print_error_message(f"Payment failed: {message}")
+                self._err(f"Payment failed: {message}")
 
-        except ValueError:
-            self.style.print_error_message("Invalid amount! Please enter a valid number.")
         except Exception as e:
-            self.style.print_error_message(f"Payment error: {e}")
+            self._err(f"Payment error: {e}")
 
     def deposit_money(self):
         """Handle money deposits"""
         self.style.print_section_title("DEPOSIT MONEY")
 
         try:
-            amount = float(input("Enter deposit amount: R"))
-
-            if amount <= 0:
-                self.style.print_error_message("Amount must be greater than zero!")
+            amount = self._read_amount("Enter deposit amount: R")
+            if amount is None:
                 return
 
             success, message = self.current_account.deposit(amount)
 
             if success:
-                self.style.print_success_message(
+                self._refresh_balance()
+                self._ok(
                     f"Deposit successful!\n"
-                    f"Amount Deposited: R{amount:,.2f}\n"
-                    f"New Balance: R{self.current_account.get_balance():,.2f}"
+                    f"Amount Deposited: {format_currency(amount)}\n"
+                    f"New Balance: {self._balance_str}"
                 )
                 self.update_account_registry()
             else:
-                self.style.print_error_message(f"Deposit failed: {message}")
+                self._err(f"Deposit failed: {message}")
 
-        except ValueError:
-            self.style.print_error_message("Invalid amount! Please enter a valid number.")
         except Exception as e:
-            self.style.print_error_message(f"Deposit error: {e}")
+            self._err(f"Deposit error: {e}")
 
     def withdraw_money(self):
         """Handle money withdrawals"""
         self.style.print_section_title("WITHDRAW MONEY")
 
         try:
-            current_balance = self.current_account.get_balance()
-            print(f"Available Balance: R{current_balance:,.2f}")
+            self._current_balance()
+            print(f"Available Balance: {self._balance_str}")
 
-            amount = float(input("Enter withdrawal amount: R"))
-
-            if amount <= 0:
-                self.style.print_error_message("Amount must be greater than zero!")
+            amount = self._read_amount("Enter withdrawal amount: R")
+            if amount is None:
                 return
 
             success, message = self.current_account.withdraw(amount)
 
             if success:
-                self.style.print_success_message(
+                self._refresh_balance()
+                self._ok(
                     f"Withdrawal successful!\n"
-                    f"Amount Withdrawn: R{amount:,.2f}\n"
-                    f"New Balance: R{self.current_account.get_balance():,.2f}"
+                    f"Amount Withdrawn: {format_currency(amount)}\n"
+                    f"New Balance: {self._balance_str}"
                 )
                 self.update_account_registry()
             else:
-                self.style.print_error_message(f"Withdrawal failed: {message}")
+                self._err(f"Withdrawal failed: {message}")
 
-        except ValueError:
-            self.style.print_error_message("Invalid amount! Please enter a valid number.")
         except Exception as e:
-            self.style.print_error_message(f"Withdrawal error: {e}")
+            self._err(f"Withdrawal error: {e}")
 
     def check_balance(self):
         """Display current account balance"""
         self.style.print_section_title("ACCOUNT BALANCE")
-        balance = self.current_account.get_balance()
-        print(f"Your current balance is: R{balance:,.2f}")
+        self._current_balance()
+        print(f"Your current balance is: {self._balance_str}")
         input("\nPress Enter to continue...")
 
     def show_account_info(self):
@@ -396,55 +509,94 @@ class BillingSystem:
         input("\nPress Enter to continue...")
 
     def update_account_registry(self):
-        """Update account balance in the registry"""
+        """Update account balance in the cached registry"""
         try:
-            accounts = self.account_manager.get_accounts_list()
-            account_id_str = str(self.current_account.account_id)
-            if account_id_str in accounts:
-                accounts[account_id_str]['balance'] = self.current_account.get_balance()
-                self.account_manager.save_accounts_list(accounts)
+            accounts = self._accounts()
+            account_id = self.current_account.account_id
+            if account_id in accounts:
+                accounts[account_id]['balance'] = self._current_balance()
+                self._registry_dirty = True
+                self._pending_updates += 1
+
+                # Write periodically so a crash loses at most a few updates
+                if self._pending_updates >= REGISTRY_FLUSH_INTERVAL:
+                    self._flush_registry()
         except Exception as e:
             print(f"Warning: Failed to update account registry: {e}")
 
+    def _flush_registry(self):
+        """Save the cached registry to disk if it has unsaved updates, returning success"""
+        if not self._registry_dirty:
+            return True
+
+        try:
+            if self.account_manager.save_accounts_list(self._accounts()):
+                self._registry_dirty = False
+                self._pending_updates = 0
+                return True
+        except Exception as e:
+            print(f"Warning: Failed to save account registry: {e}")
+
+        self.style.print_warning_message("Account registry could not be saved. Changes will be retried.")
+        return False
+
     def logout(self):
         """Logout current user"""
         if self.current_account:
-            self.update_account_registry()
+            saved = self._flush_registry()
             self.current_account = None
-            self.style.print_success_message("Successfully logged out!")
+            self._balance = None
+            self._balance_str = None
+            self._current_name = None
+
+            if saved:
+                self._accounts_cache = None
+                self._ok("Successfully logged out!")
+            else:
+                # The cached registry holds the only copy of the unsaved updates
+                self.style.print_warning_message("Logged out, but account changes are not saved yet.")
 
     def get_menu_choice(self, min_choice, max_choice):
         """Get and validate menu choice"""
         try:
-            choice = int(input(f"Select option ({min_choice}-{max_choice}): "))
-            if min_choice <= choice <= max_choice:
-                self.style.print_separator()
-                return choice
-            else:
-                self.style.print_error_message(f"Please select a number between {min_choice} and {max_choice}!")
-                return None
-        except ValueError:
-            self.style.print_error_message("Please enter a valid number!")
-            return None
+            raw_choice = input(f"Select option ({min_choice}-{max_choice}): ").strip()
         except KeyboardInterrupt:
             print("\nOperation cancelled.")
             return None
 
+        # Menu choices are single digits, so check those without int()
+        if len(raw_choice) == 1 and '0' <= raw_choice <= '9':
+            choice = ord(raw_choice) - 48
+        else:
+            try:
+                choice = int(raw_choice)
+            except ValueError:
+                self._err("Please enter a valid number!")
+                return None
+
+        if min_choice <= choice <= max_choice:
+            self._print_sep()
+            return choice
+        else:
+            self._err(f"Please select a number between {min_choice} and {max_choice}!")
+            return None
+
     def handle_exit(self):
         """Handle system exit"""
         self.style.print_section_title("EXIT CONFIRMATION")
 
-        if self.current_account:
-            self.update_account_registry()
+        # Write any registry updates still pending, including ones kept after a failed save
+        saved = self._flush_registry()
 
         response = input("Are you sure you want to exit? (y/N): ").lower()
 
         if response in ['y', 'yes']:
-            self.style.print_header("GOODBYE")
+            self._print_header("GOODBYE")
             print("Thank you for using JM TSIE Billing System!")
-            print("All account data has been saved successfully.")
+            if saved:
+                print("All account data has been saved successfully.")
             print("Have a great day!")
-            self.style.print_separator()
+            self._print_sep()
             self.running = False
             sys.exit(0)
         else:
@@ -2,10 +2,52 @@
 # Handles file operations, account management, and display formatting
 
 import os
+import re
+import sys
 import json
+import math
+import mmap
+import atexit
+import shutil
+import tempfile
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 import random
 
+# orjson is an optional, faster drop-in for the standard library json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rand currency format, defined once for every amount shown to the user
+_CURRENCY_FMT = "R{:,.2f}".format
+
+# Characters not allowed in account names
+_INVALID_NAME_RE = re.compile(r'[<>/\\|:*?"]')
+
+# Currency symbol, thousands separators and spaces removed from amounts in one pass
+_AMOUNT_STRIP = str.maketrans('', '', 'R, ')
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by the json module may hold NaN or Infinity, which orjson rejects
+            pass
+    return json.loads(data)
+
+
+def json_dumps(data, indent=False):
+    """Serialize data to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
 
 class FileManager:
     """Handles all file I/O operations for the billing system"""
@@ -13,6 +55,10 @@ class FileManager:
     def __init__(self, accounts_folder="accounts", registry_file="accounts_registry.json"):
         self.accounts_folder = accounts_folder
         self.registry_file = registry_file
+        # Balances already read from disk: {account_id: (file_stamp, balance)}
+        self._balance_cache = {}
+        # Balance file paths already built: {account_id: path}
+        self._path_cache = {}
         self.ensure_directories_exist()
 
     def ensure_directories_exist(self):
@@ -28,10 +74,11 @@ class FileManager:
         """Load data from a JSON file"""
         try:
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read().strip()
-                    if content:
-                        return json.loads(content)
+                with open(file_path, 'rb') as file:
+                    content = file.read()
+                # Parse the raw bytes directly; the parser skips surrounding whitespace
+                if content and not content.isspace():
+                    return json_loads(content)
             return {}
         except json.JSONDecodeError as e:
             print(f"Error: Corrupted JSON file {file_path}: {e}")
@@ -47,40 +94,100 @@ class FileManager:
             print(f"Error loading {file_path}: {e}")
             return {}
 
+    def backup_file(self, file_path):
+        """Keep the current contents of a file as '<file>.backup'"""
+        if not os.path.exists(file_path):
+            return
+
+        backup_path = f"{file_path}.backup"
+        try:
+            # A hard link shares the existing data, so no bytes are copied
+            link_path = f"{backup_path}.tmp"
+            if os.path.exists(link_path):
+                os.remove(link_path)
+            os.link(file_path, link_path)
+            os.replace(link_path, backup_path)
+        except (OSError, AttributeError):
+            # No hard link support, fall back to a kernel-side copy where available
+            try:
+                shutil.copyfile(file_path, backup_path)
+            except Exception:
+                pass  # Backup failed, but continue with save
+
+    def write_file_atomic(self, file_path, data):
+        """Write bytes to a file by renaming a fully written temporary file over it"""
+        # A unique temporary file in the same directory, so concurrent saves never share one
+        directory, name = os.path.split(file_path)
+        fd, temp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or '.')
+        try:
+            # Files here are small, so write with raw OS calls and skip the buffered file object
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                # The data must be on disk before the rename makes it the live file
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            # mkstemp creates owner-only files; keep the permissions saved files had before
+            os.chmod(temp_path, 0o644)
+            # The old file survives as the backup once the new one is renamed in
+            self.backup_file(file_path)
+            # The rename is atomic, so readers see either the old or the new content
+            os.replace(temp_path, file_path)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
     def save_json_file(self, file_path, data):
         """Save data to a JSON file"""
         try:
-            # Create backup before saving
-            if os.path.exists(file_path):
-                backup_path = f"{file_path}.backup"
-                try:
-                    with open(file_path, 'r') as src, open(backup_path, 'w') as dst:
-                        dst.write(src.read())
-                except Exception:
-                    pass  # Backup failed, but continue with save
-
-            # Save the data
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            self.write_file_atomic(file_path, json_dumps(data, indent=True))
             return True
         except Exception as e:
             print(f"Error saving {file_path}: {e}")
             return False
 
+    def get_file_stamp(self, file_path):
+        """Get an (mtime, ctime, size, inode) stamp that changes whenever the file is rewritten"""
+        try:
+            stat = os.stat(file_path)
+            # Inode and ctime catch same-size rewrites within the filesystem's mtime granularity
+            return stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino
+        except OSError:
+            return None
+
     def get_account_balance_path(self, account_id):
         """Get file path for account balance"""
-        return os.path.join(self.accounts_folder, f"account_{account_id}_balance.txt")
+        path = self._path_cache.get(account_id)
+        if path is None:
+            path = os.path.join(self.accounts_folder, f"account_{account_id}_balance.txt")
+            self._path_cache[account_id] = path
+        return path
 
     def load_balance_from_file(self, account_id, default_balance=1000000):
         """Load account balance from file"""
         try:
             balance_file = self.get_account_balance_path(account_id)
-            if os.path.exists(balance_file):
+            stamp = self.get_file_stamp(balance_file)
+
+            # Serve from memory while the file is unchanged on disk
+            cached = self._balance_cache.get(account_id)
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            if stamp is not None:
                 with open(balance_file, 'r', encoding='utf-8') as file:
                     content = file.read().strip()
                     if content:
                         balance = float(content)
-                        return balance if balance >= 0 else default_balance
+                        if balance < 0:
+                            return default_balance
+                        self._balance_cache[account_id] = (stamp, balance)
+                        return balance
             # File doesn't exist, create it with default balance
             self.save_balance_to_file(account_id, default_balance)
             return default_balance
@@ -99,19 +206,17 @@ class FileManager:
                 return False
 
             balance_file = self.get_account_balance_path(account_id)
+            self._balance_cache.pop(account_id, None)
 
-            # Create backup of current balance
-            if os.path.exists(balance_file):
-                backup_file = f"{balance_file}.backup"
-                try:
-                    with open(balance_file, 'r') as src, open(backup_file, 'w') as dst:
-                        dst.write(src.read())
-                except Exception:
-                    pass
-
-            # Save new balance
-            with open(balance_file, 'w', encoding='utf-8') as file:
-                file.write(str(float(balance)))
+            if not isinstance(balance, float):
+                balance = float(balance)
+            # repr() is the shortest string that round-trips to the same float
+            self.write_file_atomic(balance_file, repr(balance).encode('ascii'))
+
+            # Write-through: the next load is served from memory until the file changes
+            stamp = self.get_file_stamp(balance_file)
+            if stamp is not None:
+                self._balance_cache[account_id] = (stamp, balance)
             return True
         except Exception as e:
             print(f"Error saving balance for account {account_id}: {e}")
@@ -123,15 +228,45 @@ class AccountManager:
 
     def __init__(self):
         self.file_manager = FileManager()
+        # Last registry read, reused while the registry file stamp is unchanged
+        self._registry_stamp = None
+        self._registry_cache = {}
+
+    def load_registry(self):
+        """Load the registry into memory if the file changed since the last read"""
+        registry_file = self.file_manager.registry_file
+        stamp = self.file_manager.get_file_stamp(registry_file)
+
+        if stamp is None or stamp != self._registry_stamp:
+            accounts = self.file_manager.load_json_file(registry_file)
+            # JSON object keys are always strings; use int keys in memory
+            self._registry_cache = {int(acc_id): acc_info for acc_id, acc_info in accounts.items()}
+            self._registry_stamp = stamp
+
+        return self._registry_cache
 
     def get_accounts_list(self):
-        """Get list of all registered accounts"""
-        return self.file_manager.load_json_file(self.file_manager.registry_file)
+        """Get list of all registered accounts, keyed by integer account ID"""
+        # Callers modify the returned entries, so hand out copies
+        return {
+            acc_id: dict(acc_info) if isinstance(acc_info, dict) else acc_info
+            for acc_id, acc_info in self.load_registry().items()
+        }
+
+    def iter_accounts(self):
+        """Iterate over (account_id, account_info) pairs without copying the registry"""
+        yield from self.load_registry().items()
 
     def save_accounts_list(self, accounts):
         """Save accounts list to registry"""
+        self._registry_stamp = None
+        accounts = {str(acc_id): acc_info for acc_id, acc_info in accounts.items()}
         return self.file_manager.save_json_file(self.file_manager.registry_file, accounts)
 
+    def read_balance(self, account_id):
+        """Read an account balance straight from its balance file"""
+        return float(self.file_manager.load_balance_from_file(account_id))
+
     def create_new_account(self, account_name, initial_balance=1000000):
         """Create a new account without authentication"""
         try:
@@ -140,16 +275,16 @@ class AccountManager:
                 raise ValueError("Account name cannot be empty")
 
             initial_balance = float(initial_balance)
+            if not math.isfinite(initial_balance):
+                raise ValueError("Initial balance must be a finite number")
             if initial_balance < 0:
                 raise ValueError("Initial balance cannot be negative")
 
             # Load existing accounts
             accounts = self.get_accounts_list()
 
-            # Generate unique account ID
-            account_id = 1
-            while str(account_id) in accounts:
-                account_id += 1
+            # Generate unique account ID, one past the highest in use
+            account_id = max(accounts, default=0) + 1
 
             # Create account information
             account_info = {
@@ -160,14 +295,14 @@ class AccountManager:
             }
 
             # Save to registry
-            accounts[str(account_id)] = account_info
+            accounts[account_id] = account_info
             if not self.save_accounts_list(accounts):
                 raise Exception("Failed to save account registry")
 
             # Create balance file
             if not self.file_manager.save_balance_to_file(account_id, initial_balance):
                 # Rollback registry changes
-                del accounts[str(account_id)]
+                del accounts[account_id]
                 self.save_accounts_list(accounts)
                 raise Exception("Failed to create balance file")
 
@@ -210,6 +345,8 @@ class BankAccount:
         """Deposit money into the account"""
         try:
             amount = float(amount)
+            if not math.isfinite(amount):
+                return False, "Invalid amount format"
             if amount <= 0:
                 return False, "Deposit amount must be positive"
 
@@ -219,7 +356,7 @@ class BankAccount:
 
             # Save to file
             if self.save_balance():
-                return True, f"Deposit successful. New balance: R{self.balance:,.2f}"
+                return True, f"Deposit successful. New balance: {_CURRENCY_FMT(self.balance)}"
             else:
                 # Rollback on save failure
                 self.balance = old_balance
@@ -234,11 +371,13 @@ class BankAccount:
         """Withdraw money from the account"""
         try:
             amount = float(amount)
+            if not math.isfinite(amount):
+                return False, "Invalid amount format"
             if amount <= 0:
                 return False, "Withdrawal amount must be positive"
 
             if amount > self.balance:
-                return False, f"Insufficient funds. Available: R{self.balance:,.2f}"
+                return False, f"Insufficient funds. Available: {_CURRENCY_FMT(self.balance)}"
 
             # Update balance
             old_balance = self.balance
@@ -246,7 +385,7 @@ class BankAccount:
 
             # Save to file
             if self.save_balance():
-                return True, f"Withdrawal successful. New balance: R{self.balance:,.2f}"
+                return True, f"Withdrawal successful. New balance: {_CURRENCY_FMT(self.balance)}"
             else:
                 # Rollback on save failure
                 self.balance = old_balance
@@ -261,29 +400,47 @@ class BankAccount:
         """Get detailed account information"""
         try:
             accounts = self.account_manager.get_accounts_list()
-            if str(self.account_id) in accounts:
-                account_data = accounts[str(self.account_id)]
+            if self.account_id in accounts:
+                account_data = accounts[self.account_id]
                 return (
                     f"Account ID: {self.account_id}\n"
                     f"Account Name: {account_data.get('name', 'Unknown')}\n"
                     f"Created: {account_data.get('created', 'Unknown')}\n"
-                    f"Current Balance: R{self.balance:,.2f}\n"
+                    f"Current Balance: {_CURRENCY_FMT(self.balance)}\n"
                     f"Balance File: {self.file_manager.get_account_balance_path(self.account_id)}"
                 )
             else:
-                return f"Account ID: {self.account_id}\nBalance: R{self.balance:,.2f}\nStatus: Registry data missing"
+                return f"Account ID: {self.account_id}\nBalance: {_CURRENCY_FMT(self.balance)}\nStatus: Registry data missing"
         except Exception as e:
-            return f"Account ID: {self.account_id}\nBalance: R{self.balance:,.2f}\nError: {e}"
+            return f"Account ID: {self.account_id}\nBalance: {_CURRENCY_FMT(self.balance)}\nError: {e}"
 
 
 class BillingStyle:
     """Handles all display formatting and user interface styling"""
 
+    # Verbosity levels: 0 shows no status messages, 1 only errors and warnings, 2 everything
+    VERBOSITY_ERRORS = 1
+    VERBOSITY_ALL = 2
+
     def __init__(self, width=70):
         self.width = width
+        try:
+            self.verbosity = int(os.getenv("BILLING_VERBOSITY", self.VERBOSITY_ALL))
+        except ValueError:
+            self.verbosity = self.VERBOSITY_ALL
+
+        # Windows consoles only process ANSI escape codes after a system() call has enabled them
+        if os.name == 'nt':
+            os.system('')
         self.separator = "=" * width
         self.thin_separator = "-" * width
 
+        # Line layouts defined once here so every table and title uses the same widths
+        self._title_fmt = f"{{:^{width}}}".format
+        self._acct_row_fmt = "{:<5} {:<25} {:<12} {}".format
+        self._table_cell_fmt = "{:^12}".format
+        self._acct_list_header = self._acct_row_fmt('ID', 'Name', 'Created', 'Balance')
+
     def print_separator(self):
         """Print main separator line"""
         print(self.separator)
@@ -292,44 +449,58 @@ class BillingStyle:
         """Print thin separator line"""
         print(self.thin_separator)
 
+    def format_header(self, title):
+        """Build a formatted header as a single string"""
+        return f"{self.separator}\n{title.center(self.width)}\n{self.separator}\n"
+
     def print_header(self, title):
         """Print a formatted header"""
-        self.print_separator()
-        print(title.center(self.width))
-        self.print_separator()
+        sys.stdout.write(self.format_header(title))
 
     def print_section_title(self, title):
         """Print a section title"""
         print(f"\n{title}")
         self.print_thin_separator()
 
+    def format_menu(self, options):
+        """Build a formatted menu as a single string"""
+        lines = [f"{i}. {option}" for i, option in enumerate(options, 1)]
+        lines.append(self.separator)
+        return "\n".join(lines) + "\n"
+
     def print_menu(self, options):
         """Print a formatted menu"""
         try:
-            for i, option in enumerate(options, 1):
-                print(f"{i}. {option}")
-            self.print_separator()
+            sys.stdout.write(self.format_menu(options))
         except Exception as e:
             print(f"Menu display error: {e}")
             self.print_separator()
 
     def print_success_message(self, message):
         """Print a success message"""
+        if self.verbosity < self.VERBOSITY_ALL:
+            return
         print(f"\n[SUCCESS] {message}")
         self.print_separator()
 
     def print_error_message(self, message):
         """Print an error message"""
+        if self.verbosity < self.VERBOSITY_ERRORS:
+            return
         print(f"\n[ERROR] {message}")
         self.print_separator()
 
     def print_info_message(self, message):
         """Print an information message"""
+        if self.verbosity < self.VERBOSITY_ALL:
+            return
         print(f"\n[INFO] {message}")
         self.print_separator()
 
     def print_warning_message(self, message):
         """Print a warning message"""
+        if self.verbosity < self.VERBOSITY_ERRORS:
+            return
         print(f"\n[WARNING] {message}")
         self.print_separator()
 
@@ -337,7 +508,7 @@ class BillingStyle:
         """Print formatted balance information"""
         try:
             balance = float(balance)
-            print(f"\nCurrent Balance: R{balance:,.2f}")
+            print(f"\nCurrent Balance: {_CURRENCY_FMT(balance)}")
             self.print_separator()
         except Exception as e:
             print(f"\nBalance Display Error: {e}")
@@ -347,10 +518,10 @@ class BillingStyle:
         """Print transaction confirmation"""
         try:
             amount = float(amount)
-            print(f"\n{'TRANSACTION COMPLETED':^{self.width}}")
+            print(f"\n{self._title_fmt('TRANSACTION COMPLETED')}")
             self.print_thin_separator()
             print(f"Service: {service}")
-            print(f"Amount: R{amount:,.2f}")
+            print(f"Amount: {_CURRENCY_FMT(amount)}")
             if token:
                 print(f"Reference Token: {token}")
             print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -366,11 +537,17 @@ class BillingStyle:
                 print("No accounts registered.")
                 return
 
-            print(f"\n{'REGISTERED ACCOUNTS':^{self.width}}")
-            self.print_thin_separator()
-            print(f"{'ID':<5} {'Name':<25} {'Created':<12} {'Balance'}")
-            self.print_thin_separator()
-
+            # Build the whole table and write it to stdout in one call
+            rows = [
+                f"\n{self._title_fmt('REGISTERED ACCOUNTS')}",
+                self.thin_separator,
+                self._acct_list_header,
+                self.thin_separator
+            ]
+
+            # Hoist lookups out of the per-account loop
+            add_row = rows.append
+            row_fmt = self._acct_row_fmt
             for acc_id, acc_info in accounts.items():
                 if isinstance(acc_info, dict):
                     name = acc_info.get('name', 'Unknown')[:24]  # Truncate if too long
@@ -378,33 +555,40 @@ class BillingStyle:
                     balance = acc_info.get('balance', 0)
                     try:
                         balance = float(balance)
-                        balance_str = f"R{balance:,.2f}"
+                        balance_str = _CURRENCY_FMT(balance)
                     except (ValueError, TypeError):
                         balance_str = "Error"
 
-                    print(f"{acc_id:<5} {name:<25} {created:<12} {balance_str}")
+                    add_row(row_fmt(acc_id, name, created, balance_str))
 
-            self.print_separator()
+            rows.append(self.separator)
+            sys.stdout.write("\n".join(rows) + "\n")
         except Exception as e:
             print(f"Account list display error: {e}")
             self.print_separator()
 
     def print_table_header(self, headers):
         """Print formatted table header"""
-        header_line = " | ".join(f"{header:^12}" for header in headers)
+        cell_fmt = self._table_cell_fmt
+        header_line = " | ".join(cell_fmt(header) for header in headers)
         print(header_line)
         self.print_thin_separator()
 
     def print_table_row(self, data):
         """Print formatted table row"""
-        row_line = " | ".join(f"{str(item):^12}" for item in data)
+        cell_fmt = self._table_cell_fmt
+        row_line = " | ".join(cell_fmt(str(item)) for item in data)
         print(row_line)
 
     def clear_screen(self):
         """Clear the console screen"""
         try:
+            # Terminals: clear and move the cursor home with ANSI escape codes
+            if sys.stdout.isatty():
+                sys.stdout.write("\x1b[2J\x1b[H")
+                sys.stdout.flush()
             # Windows
-            if os.name == 'nt':
+            elif os.name == 'nt':
                 os.system('cls')
             # Unix/Linux/MacOS
             else:
@@ -440,18 +624,36 @@ class BillingStyle:
 
     def display_loading(self, message="Processing"):
         """Display a simple loading message"""
+        if self.verbosity < self.VERBOSITY_ALL:
+            return
         print(f"{message}...", end="", flush=True)
 
     def display_complete(self):
         """Display completion message"""
+        if self.verbosity < self.VERBOSITY_ALL:
+            return
         print(" Done!")
 
 
 class TransactionLogger:
     """Handles logging of transactions for audit purposes"""
 
-    def __init__(self, log_folder="logs"):
+    def __init__(self, log_folder="logs", batch_size=64, fsync_interval=5.0, max_open_files=32,
+                 max_write_attempts=3):
         self.log_folder = log_folder
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self.max_open_files = max_open_files
+        self.max_write_attempts = max_write_attempts
+        # Serialized entries waiting to be written: (account_id, line_bytes, failed_attempts)
+        self._pending = deque()
+        # Append-mode log files kept open between writes, least recently used first: {account_id: file}
+        self._files = OrderedDict()
+        # Accounts with written entries not yet forced to disk, synced at most once per fsync_interval
+        self._dirty = set()
+        self._last_fsync = time.monotonic()
+        # Whether close is registered to run at exit, only while entries are queued or files are open
+        self._close_at_exit = False
         self.ensure_log_folder()
 
     def ensure_log_folder(self):
@@ -462,11 +664,26 @@ class TransactionLogger:
         except Exception as e:
             print(f"Warning: Could not create log folder: {e}")
 
+    def get_log_path(self, account_id):
+        """Get file path for an account's transaction log"""
+        return os.path.join(self.log_folder, f"account_{account_id}_transactions.log")
+
+    def get_log_file(self, account_id):
+        """Get the open append-mode log file for an account, opening it on first use"""
+        file = self._files.get(account_id)
+        if file is None:
+            # Close the least recently used file so open descriptors stay bounded
+            if len(self._files) >= self.max_open_files:
+                self.close_log_file(next(iter(self._files)))
+            file = open(self.get_log_path(account_id), 'ab')
+            self._files[account_id] = file
+        else:
+            self._files.move_to_end(account_id)
+        return file
+
     def log_transaction(self, account_id, transaction_type, amount, service=None, token=None):
-        """Log a transaction to file"""
+        """Queue a transaction log entry, writing the queue once it reaches batch_size"""
         try:
-            log_file = os.path.join(self.log_folder, f"account_{account_id}_transactions.log")
-
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = {
                 "timestamp": timestamp,
@@ -476,30 +693,132 @@ class TransactionLogger:
                 "token": token
             }
 
-            with open(log_file, 'a', encoding='utf-8') as file:
-                file.write(f"{json.dumps(log_entry)}\n")
+            self._pending.append((account_id, json_dumps(log_entry) + b"\n", 0))
+            if not self._close_at_exit:
+                # Write out anything still buffered, sync and close the files when the program exits
+                atexit.register(self.close)
+                self._close_at_exit = True
+
+            # Write failures are reported by flush, the entry itself is queued either way
+            if len(self._pending) >= self.batch_size:
+                self.flush()
 
             return True
         except Exception as e:
             print(f"Warning: Could not log transaction: {e}")
             return False
 
+    def flush(self):
+        """Write all queued log entries with a single write per account, returning False if any write failed"""
+        batches = {}
+        while self._pending:
+            account_id, line, attempts = self._pending.popleft()
+            batches.setdefault(account_id, []).append((line, attempts))
+
+        failed = []
+        dropped = 0
+        for account_id, entries in batches.items():
+            try:
+                file = self.get_log_file(account_id)
+                file.write(b"".join(line for line, _ in entries))
+                file.flush()
+                self._dirty.add(account_id)
+            except Exception as e:
+                print(f"Warning: Could not log transaction: {e}")
+                # Reopen the file on the next write
+                self.close_log_file(account_id)
+                for line, attempts in entries:
+                    if attempts + 1 < self.max_write_attempts:
+                        failed.append((account_id, line, attempts + 1))
+                    else:
+                        dropped += 1
+
+        # Put unwritten entries back at the front of the queue, in order, to retry on the next flush;
+        # entries that keep failing are dropped so a broken log cannot make every call retry it
+        self._pending.extendleft(reversed(failed))
+        if dropped:
+            print(f"Warning: Dropped {dropped} transaction log entries after {self.max_write_attempts} failed writes")
+
+        if self._dirty and time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self.sync()
+        return not (failed or dropped)
+
+    def sync(self):
+        """Force written log entries to disk for every account with unsynced writes"""
+        for account_id in self._dirty:
+            file = self._files.get(account_id)
+            if file is not None:
+                try:
+                    os.fsync(file.fileno())
+                except Exception as e:
+                    print(f"Warning: Could not sync transaction log: {e}")
+        self._dirty.clear()
+        self._last_fsync = time.monotonic()
+
+    def close_log_file(self, account_id):
+        """Close an account's log file if it is open, syncing any unsynced writes first"""
+        dirty = account_id in self._dirty
+        self._dirty.discard(account_id)
+        file = self._files.pop(account_id, None)
+        if file is not None:
+            try:
+                if dirty:
+                    os.fsync(file.fileno())
+            except Exception as e:
+                print(f"Warning: Could not sync transaction log: {e}")
+            try:
+                file.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """Write queued entries, sync them to disk and close all open log files"""
+        self.flush()
+        self.sync()
+        for account_id in list(self._files):
+            self.close_log_file(account_id)
+
+        # Release the exit hook's reference once nothing is left to write
+        if self._close_at_exit and not self._pending:
+            atexit.unregister(self.close)
+            self._close_at_exit = False
+
     def get_transaction_history(self, account_id, limit=10):
         """Get recent transaction history"""
         try:
-            log_file = os.path.join(self.log_folder, f"account_{account_id}_transactions.log")
+            # Queued entries must be on disk before the log is read
+            self.flush()
+            log_file = self.get_log_path(account_id)
 
-            if not os.path.exists(log_file):
+            # An empty file cannot be memory-mapped
+            if not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
                 return []
 
-            transactions = []
-            with open(log_file, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            # Scan backwards from the end of the mapped file so only the last 'limit' lines are read
+            lines = []
+            with open(log_file, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                line_end = mm.size()
+                # A trailing newline ends the last line rather than starting an empty one
+                search_end = line_end - 1 if mm[line_end - 1:line_end] == b"\n" else line_end
+
+                if limit <= 0:
+                    # Same as slicing every line with [-limit:]: 0 keeps them all, -n drops the first n
+                    lines = mm[:search_end].split(b"\n")[-limit:]
+                else:
+                    while len(lines) < limit:
+                        newline_pos = mm.rfind(b"\n", 0, search_end)
+                        line_start = newline_pos + 1
+                        lines.append(mm[line_start:line_end])
+                        if newline_pos == -1:
+                            break
+                        line_end = line_start
+                        search_end = newline_pos
+                    lines.reverse()
 
-            # Get last 'limit' transactions
-            for line in lines[-limit:]:
+            transactions = []
+            for line in lines:
                 try:
-                    transaction = json.loads(line.strip())
+                    transaction = json_loads(line)
                     transactions.append(transaction)
                 except json.JSONDecodeError:
                     continue
@@ -513,9 +832,12 @@ class TransactionLogger:
 def generate_token():
     """Generate a random token for purchases"""
     try:
-        # Generate 4 groups of 4-digit numbers
-        token_parts = [f"{random.randint(1000, 9999)}" for _ in range(4)]
-        return " ".join(token_parts)
+        # Generate 4 groups of 4-digit numbers (1000-9999) from a single random draw
+        value = random.randrange(9000 ** 4)
+        value, part1 = divmod(value, 9000)
+        value, part2 = divmod(value, 9000)
+        part4, part3 = divmod(value, 9000)
+        return f"{part1 + 1000} {part2 + 1000} {part3 + 1000} {part4 + 1000}"
     except Exception:
         # Fallback token generation using timestamp
         timestamp = str(int(datetime.now().timestamp()))[-8:]
@@ -525,7 +847,7 @@ def generate_token():
 def format_currency(amount):
     """Format amount as currency"""
     try:
-        return f"R{float(amount):,.2f}"
+        return _CURRENCY_FMT(float(amount))
     except (ValueError, TypeError):
         return f"R{amount}"
 
@@ -543,8 +865,7 @@ def validate_account_name(name):
         return False, "Account name cannot exceed 50 characters"
 
     # Check for invalid characters
-    invalid_chars = ['<', '>', '/', '\\', '|', ':', '*', '?', '"']
-    if any(char in name for char in invalid_chars):
+    if _INVALID_NAME_RE.search(name):
         return False, "Account name contains invalid characters"
 
     return True, "Valid account name"
@@ -554,9 +875,12 @@ def validate_amount(amount_str):
     """Validate monetary amount"""
     try:
         # Remove currency symbols and spaces
-        clean_amount = amount_str.replace('R', '').replace(',', '').replace(' ', '')
+        clean_amount = amount_str.translate(_AMOUNT_STRIP)
         amount = float(clean_amount)
 
+        if not math.isfinite(amount):
+            return False, "Invalid amount format"
+
         if amount < 0:
             return False, "Amount cannot be negative"
 
@@ -564,7 +888,8 @@ def validate_amount(amount_str):
             return False, "Amount exceeds maximum limit"
  
         # Check for reasonable decimal places (max 2)
-        if '.' in clean_amount and len(clean_amount.split('.')[1]) > 2:
+        decimal_pos = clean_amount.rfind('.')
+        if decimal_pos != -1 and len(clean_amount) - decimal_pos - 1 > 2:
             return False, "Amount cannot have more than 2 decimal places"
 
         return True, amount
@@ -576,5 +901,5 @@ def validate_amount(amount_str):
 __all__ = [
     'FileManager', 'AccountManager', 'BankAccount', 'BillingStyle',
     'TransactionLogger', 'generate_token', 'format_currency',
-    'validate_account_name', 'validate_amount'
+    'validate_account_name', 'validate_amount', 'json_loads', 'json_dumps'
 ]
\ No newline at end of file